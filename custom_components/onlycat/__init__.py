@@ -7,6 +7,7 @@ https://github.com/OnlyCatAI/onlycat-home-assistant
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -85,20 +86,21 @@ async def async_setup_entry(
             events = await entry.runtime_data.client.send_message(
                 "getDeviceEvents", {"deviceId": device.device_id, "subscribe": True}
             )
-            if events:
-                events.sort(
-                    key=lambda e: datetime.fromisoformat(
-                        e.get(
-                            "timestamp",
-                            None,
-                        )
-                        or datetime.min.replace(tzinfo=UTC).isoformat()
-                    ),
-                    reverse=True,
-                )
-            if events and "eventId" in events[0]:
+            if not events:
+                continue
+            latest_event = max(
+                events,
+                key=lambda e: datetime.fromisoformat(
+                    e.get(
+                        "timestamp",
+                        None,
+                    )
+                    or datetime.min.replace(tzinfo=UTC).isoformat()
+                ),
+            )
+            if "eventId" in latest_event:
                 await entry.runtime_data.event_store.send_get_event_message(
-                    device.device_id, events[0]["eventId"], subscribe=False
+                    device.device_id, latest_event["eventId"], subscribe=False
                 )
 
     await refresh_subscriptions(None)
@@ -132,14 +134,16 @@ async def _initialize_devices(entry: OnlyCatConfigEntry) -> None:
 
     for device in entry.runtime_data.devices:
         device.settings = entry.runtime_data.settings
-        entry.runtime_data.client.add_event_listener(
-            "deviceUpdate", device.handle_device_update
+        entry.runtime_data.client.add_device_event_listener(
+            "deviceUpdate", device.device_id, device.handle_device_update
         )
-        entry.runtime_data.client.add_event_listener(
-            "getDevice", device.update_device_from_api
+        entry.runtime_data.client.add_device_event_listener(
+            "getDevice", device.device_id, device.update_device_from_api
         )
-        entry.runtime_data.client.add_event_listener(
-            "getDeviceTransitPolicy", device.update_device_transit_policy_from_api
+        entry.runtime_data.client.add_device_event_listener(
+            "getDeviceTransitPolicy",
+            device.device_id,
+            device.update_device_transit_policy_from_api,
         )
         if device.device_transit_policy_id is not None:
             await entry.runtime_data.client.send_message(
@@ -150,18 +154,27 @@ async def _initialize_devices(entry: OnlyCatConfigEntry) -> None:
 
 async def _initialize_pets(entry: OnlyCatConfigEntry) -> None:
     for device in entry.runtime_data.devices:
-        rfids = await entry.runtime_data.client.send_message(
-            "getLastSeenRfidCodesByDevice", {"deviceId": device.device_id}
-        )
-        last_seens = await entry.runtime_data.client.send_message(
-            "getRfidLastSeenByDevice", {"deviceId": device.device_id}
+        client = entry.runtime_data.client
+        rfids, last_seens = await asyncio.gather(
+            client.send_message(
+                "getLastSeenRfidCodesByDevice", {"deviceId": device.device_id}
+            ),
+            client.send_message(
+                "getRfidLastSeenByDevice", {"deviceId": device.device_id}
+            ),
         )
         last_seen_rfids = {last_seen["rfidCode"]: last_seen for last_seen in last_seens}
-        for rfid in rfids:
-            rfid_code = rfid["rfidCode"]
-            rfid_profile = await entry.runtime_data.client.send_message(
-                "getRfidProfile", {"deviceId": device.device_id, "rfidCode": rfid_code}
+        rfid_codes = [rfid["rfidCode"] for rfid in rfids]
+        rfid_profiles = await asyncio.gather(
+            *(
+                client.send_message(
+                    "getRfidProfile",
+                    {"deviceId": device.device_id, "rfidCode": rfid_code},
+                )
+                for rfid_code in rfid_codes
             )
+        )
+        for rfid_code, rfid_profile in zip(rfid_codes, rfid_profiles, strict=True):
             label = rfid_profile.get("label", rfid_code)
             pet = entry.runtime_data.event_store.get_pet_by_rfid(rfid_code)
             pet.label = label
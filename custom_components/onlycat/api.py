@@ -7,11 +7,16 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import aiohttp
 
     from .data import OnlyCatData
 
+import orjson
 import socketio
+from homeassistant.util.json import json_loads
+from socketio.packet import Packet
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +39,23 @@ class OnlyCatApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class _OrjsonCodec:
+    """Drop-in for the json module used by socket.io packets, backed by orjson."""
+
+    loads = staticmethod(json_loads)
+
+    @staticmethod
+    def dumps(obj: Any, **_kwargs: Any) -> str:
+        """Serialize obj to a compact JSON string."""
+        return orjson.dumps(obj).decode()
+
+
+class _OrjsonPacket(Packet):
+    """Socket.IO packet that encodes and decodes its payload with orjson."""
+
+    json = _OrjsonCodec
+
+
 class OnlyCatApiClient:
     """Only Cat API Client."""
 
@@ -49,6 +71,7 @@ class OnlyCatApiClient:
         self._data = data
         self._session = session
         self._listeners = defaultdict(list)
+        self._device_listeners = defaultdict(lambda: defaultdict(list))
         self._socket = socket or socketio.AsyncClient(
             http_session=self._session,
             reconnection=True,
@@ -56,6 +79,7 @@ class OnlyCatApiClient:
             reconnection_delay=10,
             reconnection_delay_max=10,
             ssl_verify=True,
+            serializer=_OrjsonPacket,
         )
         self._socket.on("*", self.handle_event)
         self.add_event_listener("connect", self.on_connected)
@@ -83,17 +107,59 @@ class OnlyCatApiClient:
         await self._socket.disconnect()
         await self._socket.shutdown()
 
-    def add_event_listener(self, event: str, callback: Any) -> None:
-        """Add an event listener."""
-        self._listeners[event].append(callback)
+    @staticmethod
+    def _append_callback(callbacks: list, callback: Any) -> Callable[[], None]:
+        """Append a callback to a listener list and return a function to remove it."""
+        callbacks.append(callback)
+
+        def remove_callback() -> None:
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return remove_callback
+
+    def add_event_listener(self, event: str, callback: Any) -> Callable[[], None]:
+        """Add an event listener and return a function that removes it again."""
+        remove_listener = self._append_callback(self._listeners[event], callback)
         _LOGGER.debug(
             "Added event listener for event %s: %s", event, callback.__module__
         )
+        return remove_listener
+
+    def add_device_event_listener(
+        self, event: str, device_id: str, callback: Any
+    ) -> Callable[[], None]:
+        """
+        Add an event listener only called for events of the given device.
+
+        Returns a function that removes the listener again.
+        """
+        remove_listener = self._append_callback(
+            self._device_listeners[event][device_id], callback
+        )
+        _LOGGER.debug(
+            "Added event listener for event %s and device %s: %s",
+            event,
+            device_id,
+            callback.__module__,
+        )
+        return remove_listener
+
+    def _get_callbacks(self, event: str, data: Any) -> list:
+        """Return global listeners and listeners of the device the data refers to."""
+        callbacks = self._listeners[event]
+        if event in self._device_listeners and isinstance(data, dict):
+            device_callbacks = self._device_listeners[event].get(data.get("deviceId"))
+            if device_callbacks:
+                callbacks = callbacks + device_callbacks
+        return callbacks
 
     async def handle_event(self, event: str, *args: Any) -> None:
         """Handle an event."""
         _LOGGER.debug("Received event: %s with args: %s", event, args)
-        for callback in self._listeners[event]:
+        # Listeners run one after another, later listeners rely on the state
+        # earlier ones (e.g. the device refresh) leave behind
+        for callback in self._get_callbacks(event, args[0] if args else None):
             try:
                 await callback(*args)
             except Exception:
@@ -119,7 +185,7 @@ class OnlyCatApiClient:
         _LOGGER.debug("Received reply for event %s: %s", event, reply)
         if reply is None:
             return None
-        for callback in self._listeners[event]:
+        for callback in self._get_callbacks(event, reply):
             try:
                 await callback(reply)
             except Exception:
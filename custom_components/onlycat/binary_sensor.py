@@ -24,36 +24,39 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the sensor platform."""
+    client = entry.runtime_data.client
+    event_store = entry.runtime_data.event_store
+    coordinator = entry.runtime_data.coordinator
     async_add_entities(
         sensor
         for device in entry.runtime_data.devices
         for sensor in (
             OnlyCatEventSensor(
                 device=device,
-                event_store=entry.runtime_data.event_store,
+                event_store=event_store,
             ),
             OnlyCatContrabandSensor(
                 device=device,
-                event_store=entry.runtime_data.event_store,
+                event_store=event_store,
             ),
             OnlyCatLockSensor(
                 device=device,
-                event_store=entry.runtime_data.event_store,
-                api_client=entry.runtime_data.client,
+                event_store=event_store,
+                api_client=client,
             ),
             OnlyCatHumanSensor(
                 device=device,
-                event_store=entry.runtime_data.event_store,
+                event_store=event_store,
             ),
             OnlyCatConnectionSensor(
                 device=device,
-                api_client=entry.runtime_data.client,
+                api_client=client,
             ),
             OnlyCatErrorSensor(
                 device=device,
-                api_client=entry.runtime_data.client,
-                coordinator=entry.runtime_data.coordinator,
+                api_client=client,
+                coordinator=coordinator,
             ),
         )
     )
-    entry.runtime_data.coordinator.async_update_listeners()
+    coordinator.async_update_listeners()
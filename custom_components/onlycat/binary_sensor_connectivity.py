@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -37,7 +38,7 @@ class OnlyCatConnectionSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -56,18 +57,21 @@ class OnlyCatConnectionSensor(BinarySensorEntity):
         self._attr_is_on = device.connectivity.connected
         self._attr_raw_data = None
         self.device = device
-        self._attr_unique_id = (
-            device.device_id.replace("-", "_").lower() + "_connectivity"
-        )
+        self._attr_unique_id = device.slug + "_connectivity"
         self.entity_id = "binary_sensor." + self._attr_unique_id
-
-        api_client.add_event_listener("deviceUpdate", self.on_device_update)
+        self._api_client = api_client
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._api_client.add_device_event_listener(
+                "deviceUpdate", self.device.device_id, self.on_device_update
+            )
+        )
 
     async def on_device_update(self, data: dict) -> None:
         """Handle device update event."""
-        if data["deviceId"] != self.device.device_id:
-            return
-
         device_update = DeviceUpdate.from_api_response(data)
 
         self._attr_raw_data = str(data)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -37,7 +38,7 @@ class OnlyCatContrabandSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -56,13 +57,17 @@ class OnlyCatContrabandSensor(BinarySensorEntity):
         self._attr_is_on = False
         self._attr_raw_data = None
         self.device: Device = device
-        self._attr_unique_id = (
-            device.device_id.replace("-", "_").lower() + "_contraband"
-        )
+        self._attr_unique_id = device.slug + "_contraband"
         self._event_store = event_store
         self.entity_id = "binary_sensor." + self._attr_unique_id
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
         )
 
     async def on_event_update(self, event: Event) -> None:
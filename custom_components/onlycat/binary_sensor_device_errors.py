@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -38,7 +39,7 @@ class OnlyCatErrorSensor(CoordinatorEntity, BinarySensorEntity):
 
     _attr_has_entity_name = True
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -60,42 +61,36 @@ class OnlyCatErrorSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_is_on = False
         self._attr_extra_state_attributes = {}
         self._attr_raw_data = None
+        self._written_state: tuple | None = None
         self.device: Device = device
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_errors"
+        self._attr_unique_id = device.slug + "_errors"
         self._api_client = api_client
         self.entity_id = "binary_sensor." + self._attr_unique_id
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+
+    async def async_added_to_hass(self) -> None:
+        """Write the initial state from the coordinator's current data."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_is_on = (
-            len(self.coordinator.data[self.device.device_id]["errors"]) > 0
-        )
-        if (
-            self.coordinator.data[self.device.device_id].get("metrics", None)
-            is not None
-        ):
-            metrics = {}
-            for key in [
-                x["measureName"]
-                for x in self.coordinator.data[self.device.device_id]["metrics"]
-            ]:
-                tmp = [
-                    x
-                    for x in self.coordinator.data[self.device.device_id]["metrics"]
-                    if x["measureName"] == key
-                ]
-                if len(tmp) == 0:
-                    continue
-                tmp.sort(key=lambda x: x["time"], reverse=True)
-                metrics[key] = tmp[0]["value"]
-        self._attr_extra_state_attributes = {
-            "errors": self.coordinator.data[self.device.device_id]["errors"]
-        } | (
-            metrics
-            if self.coordinator.data[self.device.device_id].get("metrics", None)
-            is not None
-            else {}
-        )
+        data = self.coordinator.data[self.device.device_id]
+        # A failed or recovered refresh keeps the data but changes availability
+        state = (data["errors"], self.available)
+        if data.get("metrics", None) is None and state == self._written_state:
+            return
+        self._written_state = state
+        self._attr_is_on = bool(data["errors"])
+        metrics = {}
+        if data.get("metrics", None) is not None:
+            # Keep only the most recent value per metric in a single pass
+            latest = {}
+            for metric in data["metrics"]:
+                key = metric["measureName"]
+                current = latest.get(key)
+                if current is None or metric["time"] > current[0]:
+                    latest[key] = (metric["time"], metric["value"])
+            metrics = {key: value for key, (_, value) in latest.items()}
+        self._attr_extra_state_attributes = {"errors": data["errors"]} | metrics
         self.async_write_ha_state()
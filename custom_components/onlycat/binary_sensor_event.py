@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -36,7 +37,7 @@ class OnlyCatEventSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -56,12 +57,17 @@ class OnlyCatEventSensor(BinarySensorEntity):
         self._attr_extra_state_attributes = {}
         self._attr_raw_data = None
         self.device: Device = device
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_event"
+        self._attr_unique_id = device.slug + "_event"
         self._event_store = event_store
         self.entity_id = "binary_sensor." + self._attr_unique_id
 
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
         )
 
     async def on_event_update(self, event: Event) -> None:
@@ -80,7 +86,7 @@ class OnlyCatEventSensor(BinarySensorEntity):
             "timestamp": event.timestamp,
             "eventTriggerSource": event.event_trigger_source.name,
         }
-        if event.event_classification:
+        if event.event_classification is not None:
             self._attr_extra_state_attributes["eventClassification"] = (
                 event.event_classification.name
             )
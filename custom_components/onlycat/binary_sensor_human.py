@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -29,6 +30,7 @@ ENTITY_DESCRIPTION = BinarySensorEntityDescription(
     icon="mdi:human",
     translation_key="onlycat_human_sensor",
 )
+_HUMAN_ACTIVITY = EventClassification.HUMAN_ACTIVITY
 
 
 class OnlyCatHumanSensor(BinarySensorEntity):
@@ -37,7 +39,7 @@ class OnlyCatHumanSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -56,20 +58,28 @@ class OnlyCatHumanSensor(BinarySensorEntity):
         self._attr_is_on = False
         self._attr_raw_data = None
         self.device: Device = device
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_human"
+        self._attr_unique_id = device.slug + "_human"
         self._event_store = event_store
         self.entity_id = "binary_sensor." + self._attr_unique_id
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
         )
 
     async def on_event_update(self, event: Event) -> None:
         """Handle event update event."""
         if not event:
             return
+        previous_state = self._attr_is_on
         if event.frame_count:
             self._attr_is_on = False
-        elif event.event_classification == EventClassification.HUMAN_ACTIVITY:
+        elif event.event_classification is _HUMAN_ACTIVITY:
             _LOGGER.debug("Human activity detected for event %s", event)
             self._attr_is_on = True
-        self.async_write_ha_state()
+        if self._attr_is_on != previous_state:
+            self.async_write_ha_state()
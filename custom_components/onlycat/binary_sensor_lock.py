@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -36,7 +37,7 @@ class OnlyCatLockSensor(BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -56,14 +57,24 @@ class OnlyCatLockSensor(BinarySensorEntity):
         self.device: Device = device
         self._current_event: Event = Event()
         self._attr_is_on = self.device.is_unlocked_in_idle_state()
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_lock"
+        self._attr_unique_id = device.slug + "_lock"
         self._event_store = event_store
         self.entity_id = "binary_sensor." + self._attr_unique_id
+        self._api_client = api_client
 
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
+        )
+        self.async_on_remove(
+            self._api_client.add_device_event_listener(
+                "deviceUpdate", self.device.device_id, self.on_device_update
+            )
         )
-        api_client.add_event_listener("deviceUpdate", self.on_device_update)
 
     async def on_event_update(self, event: Event) -> None:
         """Handle event update event."""
@@ -78,9 +89,7 @@ class OnlyCatLockSensor(BinarySensorEntity):
                 self._attr_is_on = unlocked
         self.async_write_ha_state()
 
-    async def on_device_update(self, data: dict) -> None:
+    async def on_device_update(self, data: dict) -> None:  # noqa: ARG002
         """Handle device update event."""
-        if data["deviceId"] != self.device.device_id:
-            return
         self._attr_is_on = self.device.is_unlocked_in_idle_state()
         self.async_write_ha_state()
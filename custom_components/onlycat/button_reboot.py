@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.button import (
@@ -34,7 +35,7 @@ class OnlyCatRebootButton(ButtonEntity):
     _attr_has_entity_name = True
     _attr_should_poll = False
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -51,7 +52,7 @@ class OnlyCatRebootButton(ButtonEntity):
         """Initialize the button class."""
         self.entity_description = ENTITY_DESCRIPTION
         self.device: Device = device
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_reboot"
+        self._attr_unique_id = device.slug + "_reboot"
         self._api_client = api_client
         self.entity_id = "button." + self._attr_unique_id
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
@@ -66,7 +67,7 @@ class OnlyCatLastVideo(Camera):
     _attr_supported_features = CameraEntityFeature.STREAM
     _attr_frontend_stream_type = StreamType.HLS
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -84,14 +85,18 @@ class OnlyCatLastVideo(Camera):
         self.device: Device = device
         self.entity_description = ENTITY_DESCRIPTION
         self._current_event: Event | None = None
-        self._attr_unique_id = (
-            device.device_id.replace("-", "_").lower() + "_last_activity_video"
-        )
+        self._attr_unique_id = device.slug + "_last_activity_video"
         self._event_store = event_store
         self.entity_id = "camera." + self._attr_unique_id
         self._cached_image: bytes | None = None
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
         )
 
     async def async_camera_image(
@@ -8,7 +8,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_ACCESS_TOKEN
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
     OnlyCatApiClient,
@@ -45,7 +45,7 @@ class OnlyCatFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.debug("Initializing API client")
                 client = OnlyCatApiClient(
                     user_input[CONF_ACCESS_TOKEN],
-                    session=async_create_clientsession(self.hass),
+                    session=async_get_clientsession(self.hass),
                 )
                 user_id = None
 
@@ -211,7 +211,10 @@ class OnlyCatFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     async def _validate_connection(self, client: OnlyCatApiClient) -> None:
         """Validate connection."""
         await client.connect()
-        response = await client.send_message("getDevices", {"subscribe": False})
+        try:
+            response = await client.send_message("getDevices", {"subscribe": False})
+        finally:
+            await client.disconnect()
         if (
             type(response) is dict
             and "code" in response
@@ -219,4 +222,3 @@ class OnlyCatFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         ):
             error_msg = "Invalid access token"
             raise OnlyCatApiClientAuthenticationError(error_msg)
-        await client.disconnect()
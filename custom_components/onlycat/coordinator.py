@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
     from .data.__init__ import OnlyCatConfigEntry
     from .data.device import Device
+import asyncio
 import logging
 from datetime import timedelta
 
@@ -24,9 +25,10 @@ class OnlyCatDataUpdateCoordinator(DataUpdateCoordinator):
 
     def __init__(self, hass: HomeAssistant, config_entry: OnlyCatConfigEntry) -> None:
         """Initialize global OnlyCat data updater."""
-        interval = timedelta(
-            hours=config_entry.data["settings"].get("poll_interval_hours", 1)
-        )
+        settings = config_entry.data["settings"]
+        self.poll_interval_hours = settings.get("poll_interval_hours", 1)
+        self.enable_detailed_metrics = settings.get("enable_detailed_metrics", False)
+        interval = timedelta(hours=self.poll_interval_hours)
         super().__init__(
             hass,
             _LOGGER,
@@ -44,45 +46,56 @@ class OnlyCatDataUpdateCoordinator(DataUpdateCoordinator):
         )
         if transit_policies is None:
             return
-        for policy in transit_policies:
-            await self.config_entry.runtime_data.client.send_message(
-                "getDeviceTransitPolicy",
-                {"deviceTransitPolicyId": policy["deviceTransitPolicyId"]},
+        await asyncio.gather(
+            *(
+                self.config_entry.runtime_data.client.send_message(
+                    "getDeviceTransitPolicy",
+                    {"deviceTransitPolicyId": policy["deviceTransitPolicyId"]},
+                )
+                for policy in transit_policies
             )
+        )
 
-    async def _async_update_data(self) -> dict:
-        """Fetch data."""
-        _LOGGER.debug("Updating OnlyCat coordinator data")
-        data = {}
-        for device in self.config_entry.runtime_data.devices:
-            await self.fetch_device_transit_policies(device)
-            data[device.device_id] = {}
+    async def fetch_device_data(self, device: Device) -> tuple[str, dict]:
+        """Fetch errors and metrics for a single device."""
+        await self.fetch_device_transit_policies(device)
+        device_data = {}
+        try:
+            device_data[
+                "errors"
+            ] = await self.config_entry.runtime_data.client.send_message(
+                "getDeviceErrorLogs",
+                {
+                    "deviceId": device.device_id,
+                    "limit": 100,
+                    "hours": self.poll_interval_hours,
+                    "measureName": "message",
+                },
+            )
+        except TimeoutError:
+            _LOGGER.exception("Error fetching OnlyCat errors: %s")
+        if self.enable_detailed_metrics:
             try:
-                data[device.device_id][
-                    "errors"
+                device_data[
+                    "metrics"
                 ] = await self.config_entry.runtime_data.client.send_message(
-                    "getDeviceErrorLogs",
+                    "getDeviceTelemetryMetrics",
                     {
                         "deviceId": device.device_id,
-                        "limit": 100,
-                        "hours": self.config_entry.data["settings"].get(
-                            "poll_interval_hours", 1
-                        ),
-                        "measureName": "message",
                     },
                 )
             except TimeoutError:
-                _LOGGER.exception("Error fetching OnlyCat errors: %s")
-            if self.config_entry.data["settings"].get("enable_detailed_metrics", False):
-                try:
-                    data[device.device_id][
-                        "metrics"
-                    ] = await self.config_entry.runtime_data.client.send_message(
-                        "getDeviceTelemetryMetrics",
-                        {
-                            "deviceId": device.device_id,
-                        },
-                    )
-                except TimeoutError:
-                    _LOGGER.exception("Error fetching OnlyCat metrics: %s")
-        return data
+                _LOGGER.exception("Error fetching OnlyCat metrics: %s")
+        return device.device_id, device_data
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data."""
+        _LOGGER.debug("Updating OnlyCat coordinator data")
+        return dict(
+            await asyncio.gather(
+                *(
+                    self.fetch_device_data(device)
+                    for device in self.config_entry.runtime_data.devices
+                )
+            )
+        )
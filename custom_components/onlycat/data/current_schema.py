@@ -1,5 +1,7 @@
 """Device Policy Schmema for OnlyCat integration."""
 
+from jsonschema import Draft7Validator
+
 DEVICE_POLICY_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "title": "Transit Policy Schema",
@@ -212,3 +214,24 @@ DEVICE_POLICY_SCHEMA = {
     },
     "additionalProperties": False,
 }
+
+_DOC_KEYWORDS = frozenset(("title", "description"))
+
+
+def _strip_docs(schema: object) -> object:
+    """Return a copy of a schema without documentation-only keywords."""
+    if isinstance(schema, list):
+        return [_strip_docs(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    return {
+        key: {name: _strip_docs(prop) for name, prop in value.items()}
+        if key == "properties"
+        else _strip_docs(value)
+        for key, value in schema.items()
+        if key not in _DOC_KEYWORDS
+    }
+
+
+# Build the validator once instead of re-checking the schema on every validation
+DEVICE_POLICY_VALIDATOR = Draft7Validator(_strip_docs(DEVICE_POLICY_SCHEMA))
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import logging
 import zoneinfo
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, tzinfo
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .event import EventTriggerSource
@@ -13,6 +14,8 @@ from .policy import PolicyResult
 from .type import Type
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from custom_components.onlycat.data import OnlyCatConfigEntry
 
     from .event import Event
@@ -22,7 +25,17 @@ from .policy import DeviceTransitPolicy
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _get_time_zone(timezone_str: str) -> tzinfo:
+    """Return the time zone for the given name, falling back to UTC."""
+    try:
+        return zoneinfo.ZoneInfo(timezone_str)
+    except zoneinfo.ZoneInfoNotFoundError:
+        _LOGGER.warning("Unable to parse timezone: %s", timezone_str)
+        return UTC
+
+
+@dataclass(slots=True)
 class DeviceConnectivity:
     """Data representing the connectivity of an OnlyCat device."""
 
@@ -45,7 +58,7 @@ class DeviceConnectivity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceUpdate:
     """Data representing an update to a device."""
 
@@ -68,7 +81,7 @@ class DeviceUpdate:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     """Data representing an OnlyCat device."""
 
@@ -81,7 +94,24 @@ class Device:
     device_transit_policies: dict[int, DeviceTransitPolicy] | None = None
     settings: dict | None = None
 
-    _policy_update_listeners: list[callable] = field(default_factory=list)
+    # Lower case device id with underscores, used to build entity ids
+    slug: str = field(init=False, repr=False, compare=False)
+    # Incremented whenever a transit policy of the device is added or replaced
+    policies_version: int = field(default=0, init=False, repr=False, compare=False)
+
+    _policy_update_listeners: tuple[callable, ...] = ()
+    _policy_id_update_listeners: dict[int, tuple[callable, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _last_api_device: dict | None = field(default=None, repr=False, compare=False)
+    _policy_names: list[str] | None = field(default=None, repr=False, compare=False)
+    _policy_ids_by_name: dict[str, int] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Derive the slug from the device id."""
+        self.slug = self.device_id.replace("-", "_").lower()
 
     @property
     def device_transit_policy(self) -> DeviceTransitPolicy | None:
@@ -90,6 +120,21 @@ class Device:
             return None
         return self.device_transit_policies.get(self.device_transit_policy_id, None)
 
+    @staticmethod
+    def _parse_api_fields(api_device: dict) -> dict:
+        """Parse the device fields contained in API response data."""
+        api_fields = {
+            "connectivity": DeviceConnectivity.from_api_response(
+                api_device.get("connectivity")
+            ),
+            "description": api_device.get("description"),
+            "device_transit_policy_id": api_device.get("deviceTransitPolicyId"),
+        }
+        timezone_str = api_device.get("timeZone")
+        if timezone_str is not None:
+            api_fields["time_zone"] = _get_time_zone(timezone_str)
+        return api_fields
+
     @classmethod
     def from_api_response(
         cls,
@@ -100,27 +145,13 @@ class Device:
         """Create a Device instance from API response data."""
         if api_device is None:
             return None
-        timezone_str = api_device.get("timeZone")
-        if timezone_str is not None:
-            try:
-                timezone = zoneinfo.ZoneInfo(timezone_str)
-            except zoneinfo.ZoneInfoNotFoundError:
-                _LOGGER.warning("Unable to parse timezone: %s", timezone_str)
-                timezone = UTC
-        else:
-            timezone = UTC
         device_id = api_device.get("deviceId", device_id)
         if device_id is None:
             return None
         return cls(
             device_id=device_id,
             config_entry=config_entry,
-            connectivity=DeviceConnectivity.from_api_response(
-                api_device.get("connectivity")
-            ),
-            time_zone=timezone,
-            description=api_device.get("description"),
-            device_transit_policy_id=api_device.get("deviceTransitPolicyId"),
+            **cls._parse_api_fields(api_device),
         )
 
     async def handle_device_update(self, data: dict) -> None:
@@ -136,15 +167,12 @@ class Device:
         """Update the device with data from an API response."""
         if data.get("deviceId") != self.device_id:
             return
-        updated_device = Device.from_api_response(
-            data, self.config_entry, self.device_id
-        )
-        if updated_device is None:
-            return
-        for obj_field in fields(self):
-            new_value = getattr(updated_device, obj_field.name, None)
-            if new_value is not None:
-                setattr(self, obj_field.name, new_value)
+        # The cloud often resends an unchanged device, skip parsing it again
+        if data != self._last_api_device:
+            for name, new_value in self._parse_api_fields(data).items():
+                if new_value is not None:
+                    setattr(self, name, new_value)
+            self._last_api_device = data
         if self.device_transit_policy_id is not None:
             await self.config_entry.runtime_data.client.send_message(
                 "getDeviceTransitPolicy",
@@ -153,14 +181,13 @@ class Device:
 
     def is_unlocked_in_idle_state(self) -> bool | None:
         """Check if the device is unlocked in idle state."""
-        if (
-            not self.device_transit_policy
-            or not self.device_transit_policy.transit_policy
-        ):
+        policy = self.device_transit_policy
+        transit_policy = policy.transit_policy if policy else None
+        if not transit_policy:
             _LOGGER.debug("Unable to determine lock state, no transit policy set.")
             return None
 
-        return not self.device_transit_policy.transit_policy.idle_lock
+        return not transit_policy.idle_lock
 
     def is_unlocked_by_event(self, event: Event) -> bool | None:
         """Check if the device is unlocked by the given event."""
@@ -182,14 +209,65 @@ class Device:
         self.device_transit_policies.update(
             {transit_policy.device_transit_policy_id: transit_policy}
         )
+        self._policy_names = None
+        self._policy_ids_by_name = None
+        self.policies_version += 1
         for listener in self._policy_update_listeners:
             listener()
+        for listener in self._policy_id_update_listeners.get(
+            transit_policy.device_transit_policy_id, ()
+        ):
+            listener()
 
     async def update_device_transit_policy_from_api(self, data: dict) -> None:
         """Update the device's transit policy with API response data."""
         transit_policy = DeviceTransitPolicy.from_api_response(data, self)
         await self.update_device_transit_policy(transit_policy)
 
-    def add_policy_update_listener(self, listener: callable) -> None:
-        """Add a listener to be called when the device transit policy is updated."""
-        self._policy_update_listeners.append(listener)
+    def get_policy_names(self) -> list[str]:
+        """Get the names of the device's transit policies."""
+        if self._policy_names is None:
+            self._policy_names = [
+                policy.name for policy in (self.device_transit_policies or {}).values()
+            ]
+        return self._policy_names
+
+    def get_policy_id_by_name(self, name: str) -> int | None:
+        """Get the id of the first transit policy with the given name."""
+        if self._policy_ids_by_name is None:
+            self._policy_ids_by_name = {}
+            for policy_id, policy in (self.device_transit_policies or {}).items():
+                self._policy_ids_by_name.setdefault(policy.name, policy_id)
+        return self._policy_ids_by_name.get(name)
+
+    def add_policy_update_listener(
+        self, listener: callable, policy_id: int | None = None
+    ) -> Callable[[], None]:
+        """
+        Add a listener to be called when the device transit policy is updated.
+
+        If a policy_id is given, the listener is only called for updates of
+        that policy instead of for all policies of the device.
+        Returns a function that removes the listener again.
+        """
+        if policy_id is None:
+            self._policy_update_listeners = (*self._policy_update_listeners, listener)
+        else:
+            listeners = self._policy_id_update_listeners.get(policy_id, ())
+            self._policy_id_update_listeners[policy_id] = (*listeners, listener)
+
+        def remove_listener() -> None:
+            if policy_id is None:
+                self._policy_update_listeners = tuple(
+                    other
+                    for other in self._policy_update_listeners
+                    if other != listener
+                )
+            else:
+                self._policy_id_update_listeners[policy_id] = tuple(
+                    other
+                    for other in self._policy_id_update_listeners.get(policy_id, ())
+                    if other != listener
+                )
+
+        return remove_listener
@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, fields
-from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
 
 from .type import Type
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventTriggerSource(Enum):
+class EventTriggerSource(IntEnum):
     """Enum representing the source of an OnlyCat flap event."""
 
     UNKNOWN = -1
@@ -27,8 +32,13 @@ class EventTriggerSource(Enum):
         _LOGGER.warning("Unknown event trigger source: %s", value)
         return cls.UNKNOWN
 
+    @classmethod
+    def from_value(cls, value: int) -> EventTriggerSource:
+        """Return the trigger source for an API value."""
+        return _enum_from_value(_EVENT_TRIGGER_SOURCES, cls, value)
+
 
-class EventClassification(Enum):
+class EventClassification(IntEnum):
     """Enum representing the classification of an OnlyCat flap event."""
 
     UNKNOWN = 0
@@ -44,6 +54,11 @@ class EventClassification(Enum):
         _LOGGER.warning("Unknown event classification: %s", value)
         return cls.UNKNOWN
 
+    @classmethod
+    def from_value(cls, value: int) -> EventClassification:
+        """Return the classification for an API value."""
+        return _enum_from_value(_EVENT_CLASSIFICATIONS, cls, value)
+
 
 class EventFlapstate(Enum):
     """Enum representing the flap state during an OnlyCat flap event."""
@@ -59,6 +74,11 @@ class EventFlapstate(Enum):
         _LOGGER.warning("Unknown event flap state: %s", value)
         return cls.UNKNOWN
 
+    @classmethod
+    def from_value(cls, value: int) -> EventFlapstate:
+        """Return the flap state for an API value."""
+        return _enum_from_value(_EVENT_FLAP_STATES, cls, value)
+
 
 class EventMotionstate(Enum):
     """Enum representing the motion sensor state during an OnlyCat flap event."""
@@ -74,8 +94,28 @@ class EventMotionstate(Enum):
         _LOGGER.warning("Unknown event motion sensor state: %s", value)
         return cls.UNKNOWN
 
+    @classmethod
+    def from_value(cls, value: int) -> EventMotionstate:
+        """Return the motion sensor state for an API value."""
+        return _enum_from_value(_EVENT_MOTION_STATES, cls, value)
+
+
+# Value lookups resolve known members without going through Enum.__call__
+_EVENT_TRIGGER_SOURCES = {source.value: source for source in EventTriggerSource}
+_EVENT_CLASSIFICATIONS = {
+    classification.value: classification for classification in EventClassification
+}
+_EVENT_FLAP_STATES = {state.value: state for state in EventFlapstate}
+_EVENT_MOTION_STATES = {state.value: state for state in EventMotionstate}
+
+
+def _enum_from_value(lookup: dict[int, Enum], enum: type[Enum], value: int) -> Enum:
+    """Return the enum member for a value, letting the enum handle unknown values."""
+    member = lookup.get(value)
+    return member if member is not None else enum(value)
+
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Data representing an OnlyCat flap event."""
 
@@ -88,7 +128,7 @@ class Event:
     event_classification: EventClassification | None = EventClassification.UNKNOWN
     poster_frame_index: int | None = None
     access_token: str | None = None
-    rfid_codes: list[str] | None = None
+    rfid_codes: tuple[str, ...] | None = None
 
     @classmethod
     def from_api_response(cls, api_event: dict) -> Event | None:
@@ -103,17 +143,17 @@ class Event:
             global_id=api_event.get("globalId"),
             device_id=api_event.get("deviceId"),
             event_id=api_event.get("eventId"),
-            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+            timestamp=dt_util.parse_datetime(timestamp) if timestamp else None,
             frame_count=api_event.get("frameCount"),
-            event_trigger_source=EventTriggerSource(int(trigger_source))
+            event_trigger_source=EventTriggerSource.from_value(int(trigger_source))
             if trigger_source
             else None,
-            event_classification=EventClassification(int(classification))
+            event_classification=EventClassification.from_value(int(classification))
             if classification
             else None,
             poster_frame_index=api_event.get("posterFrameIndex"),
             access_token=api_event.get("accessToken"),
-            rfid_codes=api_event.get("rfidCodes") or [],
+            rfid_codes=tuple(api_event.get("rfidCodes") or ()),
         )
 
     def update_from(self, updated_event: Event) -> None:
@@ -124,12 +164,12 @@ class Event:
             new_value = getattr(updated_event, field.name)
             if new_value is not None:
                 if field.name == "rfid_codes":
-                    old_value = getattr(self, field.name) or []
-                    new_value = old_value + list(set(new_value) - set(old_value))
+                    old_value = getattr(self, field.name) or ()
+                    new_value = old_value + tuple(set(new_value).difference(old_value))
                 setattr(self, field.name, new_value)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventUpdate:
     """Data representing an update to an OnlyCat flap event."""
 
@@ -26,6 +26,7 @@ class EventStore:
         self._current_events: dict[str, Event] = {}
         self._current_summaries: dict[str, EventSummary] = {}
         self._current_images: dict[str, bytes] = {}
+        self._last_event_updates: dict[str, dict] = {}
         self._pets: dict[str, Pet] = {}
         self._api_client: OnlyCatApiClient = api_client
 
@@ -73,6 +74,10 @@ class EventStore:
 
     async def on_event_update(self, data: dict) -> None:
         """Handle eventUpdate messages."""
+        # Updates are often delivered more than once, skip exact repeats
+        device_id = data.get("deviceId") if data else None
+        if device_id is not None and data == self._last_event_updates.get(device_id):
+            return
         update = EventUpdate.from_api_response(data)
         if not update:
             return
@@ -82,6 +87,9 @@ class EventStore:
             )
         else:
             await self.on_get_event(update.event)
+        # Only remember the update once it was handled, so a retry is processed
+        if device_id is not None:
+            self._last_event_updates[device_id] = data
 
     async def on_get_event(self, data: dict | Event) -> None:
         """Handle replies from getEvent messages."""
@@ -147,7 +155,7 @@ class EventStore:
             return
         event = self._current_events.get(device_id, None)
         if event is not None:
-            for callback in self._event_update_listeners[device_id]:
+            for callback in tuple(self._event_update_listeners[device_id]):
                 await callback(event)
 
     async def run_summary_listeners(self, device_id: str) -> None:
@@ -156,7 +164,7 @@ class EventStore:
             return
         summary = self._current_summaries.get(device_id, None)
         if summary is not None:
-            for callback in self._event_summary_update_listeners[device_id]:
+            for callback in tuple(self._event_summary_update_listeners[device_id]):
                 await callback(summary)
 
     async def run_pet_listeners(self, rfid_code: str) -> None:
@@ -165,26 +173,42 @@ class EventStore:
             return
         pet = self.get_pet_by_rfid(rfid_code)
         if pet is not None:
-            for callback in self._pet_update_listeners[rfid_code]:
+            for callback in tuple(self._pet_update_listeners[rfid_code]):
                 await callback(pet)
 
-    def add_event_listener(self, device_id: str, callback: Callable) -> None:
-        """Add function to a devices listener list."""
-        if device_id not in self._event_update_listeners:
-            self._event_update_listeners[device_id] = []
-        self._event_update_listeners[device_id].append(callback)
-
-    def add_event_summary_listener(self, device_id: str, callback: Callable) -> None:
+    @staticmethod
+    def _add_listener(
+        listeners: dict[str, list[Callable]], key: str, callback: Callable
+    ) -> Callable[[], None]:
+        """Add a callback to the listeners of key and return a function to remove it."""
+        callbacks = listeners.setdefault(key, [])
+        callbacks.append(callback)
+
+        def remove_listener() -> None:
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return remove_listener
+
+    def add_event_listener(
+        self, device_id: str, callback: Callable
+    ) -> Callable[[], None]:
+        """Add function to a devices listener list and return its remove function."""
+        return self._add_listener(self._event_update_listeners, device_id, callback)
+
+    def add_event_summary_listener(
+        self, device_id: str, callback: Callable
+    ) -> Callable[[], None]:
         """Add function to a devices event summary listener list."""
-        if device_id not in self._event_summary_update_listeners:
-            self._event_summary_update_listeners[device_id] = []
-        self._event_summary_update_listeners[device_id].append(callback)
+        return self._add_listener(
+            self._event_summary_update_listeners, device_id, callback
+        )
 
-    def add_pet_listener(self, rfid_code: str, callback: Callable) -> None:
-        """Add function to a pets listener list."""
-        if rfid_code not in self._pet_update_listeners:
-            self._pet_update_listeners[rfid_code] = []
-        self._pet_update_listeners[rfid_code].append(callback)
+    def add_pet_listener(
+        self, rfid_code: str, callback: Callable
+    ) -> Callable[[], None]:
+        """Add function to a pets listener list and return its remove function."""
+        return self._add_listener(self._pet_update_listeners, rfid_code, callback)
 
     def get_current_image(self, device_id: str) -> bytes | None:
         """Return cached image for given device."""
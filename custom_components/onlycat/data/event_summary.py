@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field, fields
-from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,7 +88,7 @@ class EventSummary:
             invalidated_at=invalidated_at,
             processing_at=processing_at,
             processing_by=processing_by,
-            timestamp=datetime.fromisoformat(timestamp_str) if timestamp_str else None,
+            timestamp=dt_util.parse_datetime(timestamp_str) if timestamp_str else None,
         )
 
     def update_from(self, updated_summary: EventSummary) -> None:
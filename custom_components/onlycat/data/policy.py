@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta, tzinfo
+from dataclasses import dataclass, field
 from enum import Enum, StrEnum
 from typing import TYPE_CHECKING
 
-from jsonschema import ValidationError, validate
+from homeassistant.helpers.json import json_dumps
+from jsonschema import ValidationError
 
-from .current_schema import DEVICE_POLICY_SCHEMA
+from .current_schema import DEVICE_POLICY_VALIDATOR
 from .event import (
     Event,
     EventClassification,
@@ -21,15 +21,22 @@ from .event import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import datetime, tzinfo
 
     from .device import Device
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def minute_of_day(timestamp: datetime, timezone: tzinfo) -> int:
+    """Return the minutes since local midnight of a timestamp in the given timezone."""
+    local_time = timestamp.astimezone(timezone)
+    return local_time.hour * 60 + local_time.minute
+
+
 def map_api_list_or_obj(api_obj: list | object, mapper: Callable) -> list:
     """Map a single object or list of objects from the API using the mapper function."""
-    if isinstance(api_obj, list):
+    if type(api_obj) is list:
         return [mapper(obj) for obj in api_obj]
     if api_obj:
         return [mapper(api_obj)]
@@ -65,7 +72,7 @@ class SoundAction(StrEnum):
         return cls.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleAction:
     """Data representing an action in a transit policy rule."""
 
@@ -102,7 +109,7 @@ class RuleAction:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeRange:
     """Data representing a range of time when a rule criteria is active."""
 
@@ -111,6 +118,25 @@ class TimeRange:
     end_hour: int
     end_minute: int
 
+    # Minutes since midnight of the range boundaries, both inclusive
+    _start: int = field(init=False, repr=False, compare=False)
+    _end: int = field(init=False, repr=False, compare=False)
+    # API representation of the range, e.g. "08:00-18:00"
+    _formatted: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the range boundaries and its API representation."""
+        self._start = self.start_hour * 60 + self.start_minute
+        self._end = self.end_hour * 60 + self.end_minute
+        self._formatted = (
+            f"{self.start_hour:02d}:{self.start_minute:02d}-"
+            f"{self.end_hour:02d}:{self.end_minute:02d}"
+        )
+
+    def to_api(self) -> str:
+        """Return the time range as used by the API."""
+        return self._formatted
+
     @classmethod
     def from_api_response(cls, api_time_range: str) -> TimeRange | None:
         """Create a TimeRange instance from API response data."""
@@ -130,25 +156,17 @@ class TimeRange:
 
     def contains_timestamp(self, timestamp: datetime, timezone: tzinfo) -> bool:
         """Check if the given timestamp is within this time range."""
-        event_time = timestamp.astimezone(timezone)
-        start_time = event_time.replace(
-            hour=self.start_hour, minute=self.start_minute, second=0, microsecond=0
-        )
-        end_time = event_time.replace(
-            hour=self.end_hour, minute=self.end_minute, second=59, microsecond=999999
-        )
+        return self.contains_minute(minute_of_day(timestamp, timezone))
 
+    def contains_minute(self, minute: int) -> bool:
+        """Check if the given minute since midnight is within this time range."""
         # Handle overnight ranges (e.g., 22:00-02:00)
-        if start_time > end_time:
-            if start_time > event_time:
-                start_time = start_time - timedelta(days=1)
-            else:
-                end_time = end_time + timedelta(days=1)
-
-        return start_time <= event_time <= end_time
+        if self._start > self._end:
+            return minute >= self._start or minute <= self._end
+        return self._start <= minute <= self._end
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleCriteria:
     """Data representing criteria for a rule in a transit policy."""
 
@@ -160,6 +178,21 @@ class RuleCriteria:
     motion_sensor_states: list[EventMotionstate]
     flap_states: list[EventFlapstate]
 
+    # Set views of the criteria lists for constant time membership tests in matches
+    _event_trigger_source_set: frozenset[EventTriggerSource] = field(
+        init=False, repr=False, compare=False
+    )
+    _event_classification_set: frozenset[EventClassification] = field(
+        init=False, repr=False, compare=False
+    )
+    _rfid_code_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the set views used for matching events."""
+        self._event_trigger_source_set = frozenset(self.event_trigger_sources)
+        self._event_classification_set = frozenset(self.event_classifications)
+        self._rfid_code_set = frozenset(self.rfid_codes)
+
     @classmethod
     def from_api_response(cls, api_criteria: dict) -> RuleCriteria | None:
         """Create a RuleCriteria instance from API response data."""
@@ -167,19 +200,21 @@ class RuleCriteria:
             return None
 
         trigger_source = map_api_list_or_obj(
-            api_criteria.get("eventTriggerSource"), EventTriggerSource
+            api_criteria.get("eventTriggerSource"), EventTriggerSource.from_value
         )
         classification = map_api_list_or_obj(
-            api_criteria.get("eventClassification"), EventClassification
+            api_criteria.get("eventClassification"), EventClassification.from_value
         )
         time_range = map_api_list_or_obj(
             api_criteria.get("timeRange"), TimeRange.from_api_response
         )
         rfid_code = map_api_list_or_obj(api_criteria.get("rfidCode"), lambda x: x)
 
-        flap_states = map_api_list_or_obj(api_criteria.get("flapState"), EventFlapstate)
+        flap_states = map_api_list_or_obj(
+            api_criteria.get("flapState"), EventFlapstate.from_value
+        )
         motion_states = map_api_list_or_obj(
-            api_criteria.get("motionSensorState"), EventMotionstate
+            api_criteria.get("motionSensorState"), EventMotionstate.from_value
         )
 
         return cls(
@@ -199,16 +234,10 @@ class RuleCriteria:
             data["rfidCode"] = self.rfid_codes
         if self.time_ranges:
             if len(self.time_ranges) == 1:
-                time_range = self.time_ranges[0]
-                data["timeRange"] = (
-                    f"{time_range.start_hour:02d}:{time_range.start_minute:02d}-"
-                    f"{time_range.end_hour:02d}:{time_range.end_minute:02d}"
-                )
+                data["timeRange"] = self.time_ranges[0].to_api()
             else:
                 data["timeRange"] = [
-                    f"{time_range.start_hour:02d}:{time_range.start_minute:02d}-"
-                    f"{time_range.end_hour:02d}:{time_range.end_minute:02d}"
-                    for time_range in self.time_ranges
+                    time_range.to_api() for time_range in self.time_ranges
                 ]
         if self.event_trigger_sources:
             if len(self.event_trigger_sources) == 1:
@@ -242,32 +271,40 @@ class RuleCriteria:
                 ]
         return data
 
-    def matches(self, event: Event, timezone: tzinfo) -> bool:
-        """Check if the event matches the criteria of this rule."""
+    def matches(
+        self, event: Event, timezone: tzinfo, event_minute: int | None = None
+    ) -> bool:
+        """
+        Check if the event matches the criteria of this rule.
+
+        event_minute may pass in the precomputed minute_of_day of the event,
+        so that it is not recomputed for every rule of a policy.
+        """
         if (
-            self.event_trigger_sources
-            and event.event_trigger_source not in self.event_trigger_sources
+            self._event_trigger_source_set
+            and event.event_trigger_source not in self._event_trigger_source_set
         ):
             return False
 
         if (
-            self.event_classifications
-            and event.event_classification not in self.event_classifications
+            self._event_classification_set
+            and event.event_classification not in self._event_classification_set
         ):
             return False
 
-        if self.rfid_codes and not any(
-            code in self.rfid_codes for code in event.rfid_codes
-        ):
+        if self._rfid_code_set and self._rfid_code_set.isdisjoint(event.rfid_codes):
             return False
 
-        return not self.time_ranges or any(
-            time_range.contains_timestamp(event.timestamp, timezone)
-            for time_range in self.time_ranges
+        if not self.time_ranges:
+            return True
+        if event_minute is None:
+            event_minute = minute_of_day(event.timestamp, timezone)
+        return any(
+            time_range.contains_minute(event_minute) for time_range in self.time_ranges
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """Data representing a rule in a transit policy."""
 
@@ -302,7 +339,7 @@ class Rule:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitPolicy:
     """Data representing a transit policy for an OnlyCat device."""
 
@@ -311,6 +348,13 @@ class TransitPolicy:
     idle_lock_battery: bool
     ux: dict | None = None  # Undocumented settings done via App (activation sound)
 
+    # Applicable rules per (ignore_flap_motion_rules, ignore_motion_sensor_rules)
+    _active_rules: dict[tuple[bool, bool], list[Rule]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Policies are replaced rather than mutated, so their dict form is memoized
+    _dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+
     @classmethod
     def from_api_response(cls, api_policy: dict) -> TransitPolicy | None:
         """Create a TransitPolicy instance from API response data."""
@@ -318,7 +362,7 @@ class TransitPolicy:
             return None
 
         rules_data = api_policy.get("rules") or []
-        all_rules = [Rule.from_api_rule(rule) for rule in rules_data]
+        all_rules = (Rule.from_api_rule(rule) for rule in rules_data)
         rules = [r for r in all_rules if isinstance(r, Rule)]
 
         return cls(
@@ -328,19 +372,41 @@ class TransitPolicy:
             ux=api_policy.get("ux"),
         )
 
+    def active_rules(
+        self, *, ignore_flap_motion_rules: bool, ignore_motion_sensor_rules: bool
+    ) -> list[Rule]:
+        """Return the enabled rules that apply with the given device settings."""
+        key = (ignore_flap_motion_rules, ignore_motion_sensor_rules)
+        rules = self._active_rules.get(key)
+        if rules is None:
+            rules = [
+                rule
+                for rule in self.rules
+                if rule.enabled
+                and rule.criteria
+                and not (ignore_flap_motion_rules and rule.criteria.flap_states)
+                and not (
+                    ignore_motion_sensor_rules and rule.criteria.motion_sensor_states
+                )
+            ]
+            self._active_rules[key] = rules
+        return rules
+
     def to_dict(self) -> dict:
         """Return a custom dict of TransitPolicy."""
-        data = {
-            "rules": [rule.to_dict() for rule in self.rules] if self.rules else [],
-            "idleLock": self.idle_lock,
-            "idleLockBattery": self.idle_lock_battery,
-        }
-        if self.ux:
-            data["ux"] = self.ux
-        return data
-
-
-@dataclass
+        if self._dict is None:
+            data = {
+                "rules": [rule.to_dict() for rule in self.rules] if self.rules else [],
+                "idleLock": self.idle_lock,
+                "idleLockBattery": self.idle_lock_battery,
+            }
+            if self.ux:
+                data["ux"] = self.ux
+            self._dict = data
+        return self._dict
+
+
+@dataclass(slots=True)
 class DeviceTransitPolicy:
     """Data representing a transit policy for an OnlyCat device."""
 
@@ -350,6 +416,17 @@ class DeviceTransitPolicy:
     transit_policy: TransitPolicy | None = None
     device: Device | None = None
 
+    # Lower case name with underscores, used to build entity ids
+    name_slug: str | None = field(init=False, repr=False, compare=False)
+
+    # Memoized dict and JSON forms, policies are replaced rather than mutated
+    _dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the name slug from the name."""
+        self.name_slug = self.name.replace(" ", "_").lower() if self.name else None
+
     @classmethod
     def from_api_response(
         cls, api_policy: dict, device: Device = None
@@ -357,11 +434,13 @@ class DeviceTransitPolicy:
         """Create a DeviceTransitPolicy instance from API response data."""
         if api_policy is None or "deviceTransitPolicyId" not in api_policy:
             return None
-        try:
-            validate(instance=api_policy, schema=DEVICE_POLICY_SCHEMA)
-        except ValidationError as e:
-            _LOGGER.warning("Transit policy API response failed schema validation")
-            _LOGGER.warning("Validation error details: %s", e)
+        # Validation only produces diagnostics, so it is skipped unless debugging
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            try:
+                DEVICE_POLICY_VALIDATOR.validate(api_policy)
+            except ValidationError as e:
+                _LOGGER.warning("Transit policy API response failed schema validation")
+                _LOGGER.warning("Validation error details: %s", e)
         _LOGGER.debug(
             "Creating DeviceTransitPolicy from API response: %s", api_policy.get("name")
         )
@@ -377,13 +456,21 @@ class DeviceTransitPolicy:
 
     def to_dict(self) -> dict:
         """Return a custom dict of DeviceTransitPolicy."""
-        return {
-            "deviceTransitPolicyId": self.device_transit_policy_id,
-            "transitPolicy": self.transit_policy.to_dict()
-            if self.transit_policy
-            else None,
-            "name": self.name,
-        }
+        if self._dict is None:
+            self._dict = {
+                "deviceTransitPolicyId": self.device_transit_policy_id,
+                "transitPolicy": self.transit_policy.to_dict()
+                if self.transit_policy
+                else None,
+                "name": self.name,
+            }
+        return self._dict
+
+    def to_json(self) -> str:
+        """Return the custom dict of DeviceTransitPolicy serialized as JSON."""
+        if self._json is None:
+            self._json = json_dumps(self.to_dict())
+        return self._json
 
     def determine_policy_result(self, event: Event) -> PolicyResult:
         """
@@ -399,22 +486,17 @@ class DeviceTransitPolicy:
             )
             return PolicyResult.UNKNOWN
         if self.transit_policy.rules:
-            for rule in self.transit_policy.rules:
-                if not rule.enabled:
-                    continue
-                if (
-                    self.device.settings["ignore_flap_motion_rules"]
-                    and rule.criteria.flap_states
-                ):
-                    continue
-                if (
-                    self.device.settings["ignore_motion_sensor_rules"]
-                    and rule.criteria.motion_sensor_states
-                ):
-                    continue
-                if not rule.criteria or not rule.criteria.matches(
-                    event, self.device.time_zone
-                ):
+            settings = self.device.settings
+            rules = self.transit_policy.active_rules(
+                ignore_flap_motion_rules=settings["ignore_flap_motion_rules"],
+                ignore_motion_sensor_rules=settings["ignore_motion_sensor_rules"],
+            )
+            time_zone = self.device.time_zone
+            event_minute = (
+                minute_of_day(event.timestamp, time_zone) if event.timestamp else None
+            )
+            for rule in rules:
+                if not rule.criteria.matches(event, time_zone, event_minute):
                     continue
                 result = (
                     PolicyResult.LOCKED if rule.action.lock else PolicyResult.UNLOCKED
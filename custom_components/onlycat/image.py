@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING
 
@@ -53,7 +54,7 @@ class OnlyCatLastImage(ImageEntity):
     _attr_has_entity_name = True
     _attr_content_type = "image/jpeg"
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -70,34 +71,27 @@ class OnlyCatLastImage(ImageEntity):
         self.entity_description = ENTITY_DESCRIPTION
         self.device: Device = device
         self._current_event: Event = Event()
-        self._attr_unique_id = (
-            device.device_id.replace("-", "_").lower() + "_last_activity_image"
-        )
+        self._attr_unique_id = device.slug + "_last_activity_image"
         self._event_store = event_store
         self.entity_id = "image." + self._attr_unique_id
         self._attr_image_url: str = ""
+        self._image_url_prefix = f"{IMAGE_BASEURL}{device.device_id}/"
         self._cached_image: bytes | None = None
-        self._event_store.add_event_listener(
-            self.device.device_id, self.on_event_update
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._event_store.add_event_listener(
+                self.device.device_id, self.on_event_update
+            )
         )
 
     async def async_image(self) -> bytes | None:
         """Return the cached image from eventstore."""
         image = self._event_store.get_current_image(self.device.device_id)
         if image is None and self._current_event is not None:
-            frame_to_show = (
-                self._current_event.poster_frame_index
-                if self._current_event.poster_frame_index is not None
-                else self._current_event.frame_count // 2
-                if self._current_event.frame_count is not None
-                else 1
-            )
-            url = (
-                f"{IMAGE_BASEURL}"
-                f"{self._current_event.device_id}/"
-                f"{self._current_event.event_id}/"
-                f"{frame_to_show}"
-            )
+            url = self._current_event_image_url()
             session = async_get_clientsession(self.hass)
             async with session.get(url) as resp:
                 if resp.status == HTTPStatus.OK:
@@ -105,6 +99,17 @@ class OnlyCatLastImage(ImageEntity):
                     self._event_store.set_current_image(self.device.device_id, image)
         return image
 
+    def _current_event_image_url(self) -> str:
+        """Return the URL of the frame to show for the current event."""
+        event = self._current_event
+        if event.poster_frame_index is not None:
+            frame_to_show = event.poster_frame_index
+        elif event.frame_count is not None:
+            frame_to_show = event.frame_count // 2
+        else:
+            frame_to_show = 1
+        return f"{self._image_url_prefix}{event.event_id}/{frame_to_show}"
+
     async def on_event_update(self, event: Event) -> None:
         """Handle event update."""
         if event is None or (
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import (
@@ -11,6 +12,7 @@ from homeassistant.components.select import (
 )
 from homeassistant.const import EntityCategory
 from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -36,6 +38,9 @@ ENTITY_DESCRIPTION = SelectEntityDescription(
     translation_key="onlycat_policy_select",
 )
 
+# Seconds to collect deviceUpdate events before applying them at once
+DEVICE_UPDATE_DEBOUNCE = 0.05
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
@@ -43,7 +48,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the select platform."""
-    entities = [
+    async_add_entities(
         OnlyCatPolicySelect(
             coordinator=entry.runtime_data.coordinator,
             device=device,
@@ -51,9 +56,7 @@ async def async_setup_entry(
             api_client=entry.runtime_data.client,
         )
         for device in entry.runtime_data.devices
-    ]
-    async_add_entities(entities)
-    entry.runtime_data.coordinator.async_update_listeners()
+    )
 
 
 class OnlyCatPolicySelect(CoordinatorEntity, SelectEntity):
@@ -64,7 +67,7 @@ class OnlyCatPolicySelect(CoordinatorEntity, SelectEntity):
     entity_category = EntityCategory.CONFIG
     _attr_translation_key = "onlycat_policy_select"
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -87,26 +90,51 @@ class OnlyCatPolicySelect(CoordinatorEntity, SelectEntity):
         self._state = None
         self._attr_raw_data = None
         self._api_client = api_client
-        self._attr_unique_id = device.device_id.replace("-", "_").lower() + "_policy"
+        self._attr_unique_id = device.slug + "_policy"
         self.entity_id = "select." + self._attr_unique_id
-        self._attr_options = [
-            policy.name for policy in (device.device_transit_policies or {}).values()
-        ]
+        self._attr_options = device.get_policy_names()
+        self._policies_version = device.policies_version
+        self._attr_current_option = None
+        self._written_state: tuple | None = None
         self.device: Device = device
         self._policies = device.device_transit_policies
+        self._pending_device_updates: list[dict] = []
+        self._device_update_debouncer: Debouncer[None] | None = None
         if device.device_transit_policy_id is not None:
             self.set_current_policy(device.device_transit_policy_id)
-        api_client.add_event_listener("deviceUpdate", self.on_device_update)
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        self._device_update_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=DEVICE_UPDATE_DEBOUNCE,
+            immediate=False,
+            function=self._flush_device_updates,
+        )
+        self.async_on_remove(self._cancel_device_update_flush)
+        self.async_on_remove(
+            self._api_client.add_device_event_listener(
+                "deviceUpdate", self.device.device_id, self.on_device_update
+            )
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._policies = self.device.device_transit_policies
-        self._attr_options = [
-            policy.name
-            for policy in (self.device.device_transit_policies or {}).values()
-        ]
+        self._attr_options = self.device.get_policy_names()
+        self._policies_version = self.device.policies_version
+        self._async_write_state_if_changed()
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write the state only if options, selection or availability changed."""
+        state = (self._attr_options, self._attr_current_option, self.available)
+        if state == self._written_state:
+            return
+        self._written_state = state
         self.async_write_ha_state()
 
     def set_current_policy(self, policy_id: int) -> None:
@@ -120,30 +148,41 @@ class OnlyCatPolicySelect(CoordinatorEntity, SelectEntity):
         self._attr_current_option = policy.name
 
     async def on_device_update(self, data: dict) -> None:
-        """Handle device update event."""
-        if data["deviceId"] != self.device.device_id:
-            return
+        """Handle device update event, coalescing bursts of updates."""
         _LOGGER.debug("Device update event received for select: %s", data)
-        device_update = DeviceUpdate.from_api_response(data)
-        self._attr_options = [
-            policy.name
-            for policy in (self.device.device_transit_policies or {}).values()
-        ]
-        if device_update.body.device_transit_policy_id:
-            self.set_current_policy(device_update.body.device_transit_policy_id)
-        self.async_write_ha_state()
+        # Without a policy id and with unchanged policies there is nothing to update
+        if (
+            not (data.get("body") or {}).get("deviceTransitPolicyId")
+            and self.device.policies_version == self._policies_version
+        ):
+            return
+        self._pending_device_updates.append(data)
+        self._device_update_debouncer.async_schedule_call()
+
+    @callback
+    def _flush_device_updates(self) -> None:
+        """Apply the device updates received since the last flush at once."""
+        pending, self._pending_device_updates = self._pending_device_updates, []
+        # Only the most recent update carrying a policy id determines the selection
+        for data in reversed(pending):
+            device_update = DeviceUpdate.from_api_response(data)
+            if device_update.body.device_transit_policy_id:
+                self.set_current_policy(device_update.body.device_transit_policy_id)
+                break
+        self._attr_options = self.device.get_policy_names()
+        self._policies_version = self.device.policies_version
+        self._async_write_state_if_changed()
+
+    @callback
+    def _cancel_device_update_flush(self) -> None:
+        """Cancel a scheduled flush of pending device updates."""
+        self._device_update_debouncer.async_shutdown()
+        self._pending_device_updates.clear()
 
     async def async_select_option(self, option: str) -> None:
         """Activate a device policy."""
         _LOGGER.info("Setting policy %s for device %s", option, self.device.device_id)
-        policy_id = next(
-            (
-                key
-                for key, policy in self.device.device_transit_policies.items()
-                if policy.name == option
-            ),
-            None,
-        )
+        policy_id = self.device.get_policy_id_by_name(option)
         await self._api_client.send_message(
             "activateDeviceTransitPolicy",
             {"deviceId": self.device.device_id, "deviceTransitPolicyId": policy_id},
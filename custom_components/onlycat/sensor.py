@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -35,7 +35,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the text platform."""
-    entities = [
+    async_add_entities(
         OnlyCatPolicySensor(
             coordinator=entry.runtime_data.coordinator,
             device=device,
@@ -45,9 +45,7 @@ async def async_setup_entry(
         )
         for device in entry.runtime_data.devices
         for policy_id, policy in (device.device_transit_policies or {}).items()
-    ]
-    async_add_entities(entities)
-    entry.runtime_data.coordinator.async_update_listeners()
+    )
 
 
 class OnlyCatPolicySensor(CoordinatorEntity, SensorEntity):
@@ -58,7 +56,7 @@ class OnlyCatPolicySensor(CoordinatorEntity, SensorEntity):
     _attr_translation_key = "onlycat_policy_sensor"
     _unrecorded_attributes = frozenset({MATCH_ALL})
 
-    @property
+    @cached_property
     def device_info(self) -> DeviceInfo:
         """Return device info to map to a device."""
         return DeviceInfo(
@@ -85,24 +83,36 @@ class OnlyCatPolicySensor(CoordinatorEntity, SensorEntity):
             translation_key="onlycat_policy_sensor",
         )
         self._api_client = api_client
-        self._attr_unique_id = (
-            device.device_id.replace("-", "_").lower()
-            + "_policy_"
-            + policy.name.replace(" ", "_").lower()
-        )
+        self._attr_unique_id = device.slug + "_policy_" + policy.name_slug
         self.policy_id = policy_id
-        self.policy = policy
         self.device: Device = device
-        self.coordinator.async_add_listener(self.update_sensor)
-        self.device.add_policy_update_listener(self.update_sensor)
+        self._policy_dict: dict | None = None
+        self._set_policy(policy)
 
-    @callback
-    def update_sensor(self) -> None:
-        """Update the sensor state."""
+    async def async_added_to_hass(self) -> None:
+        """Register listeners once the entity has been added to hass."""
+        await super().async_added_to_hass()
+        # Availability follows the coordinator, the policy only this listener
+        self.async_on_remove(
+            self.device.add_policy_update_listener(self.update_sensor, self.policy_id)
+        )
+
+    def _set_policy(self, policy: DeviceTransitPolicy) -> bool:
+        """Set the policy shown by the sensor, return whether it changed."""
+        self.policy = policy
+        policy_dict = policy.to_dict()
+        if policy_dict == self._policy_dict:
+            return False
+        self._policy_dict = policy_dict
         self._attr_native_value = "Configured"
-        self.policy = self.device.device_transit_policies.get(self.policy_id)
         self._attr_extra_state_attributes = {
-            "policy": self.policy.to_dict(),
-            "policy_json": json.dumps(self.policy.to_dict()),
+            "policy": policy_dict,
+            "policy_json": policy.to_json(),
         }
-        self.async_write_ha_state()
+        return True
+
+    @callback
+    def update_sensor(self) -> None:
+        """Update the sensor state."""
+        if self._set_policy(self.device.device_transit_policies.get(self.policy_id)):
+            self.async_write_ha_state()
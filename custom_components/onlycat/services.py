@@ -1,13 +1,14 @@
 """Provides services for OnlyCat."""
 
-import json
 import logging
+from functools import partial
 
 import voluptuous as vol
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util.json import json_loads
 
 from custom_components.onlycat.data import OnlyCatConfigEntry
 
@@ -16,6 +17,23 @@ from .device_tracker import OnlyCatPetTracker
 
 _LOGGER = logging.getLogger(__name__)
 
+SET_PET_LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_tracker"): cv.entity_id,
+        vol.Required("location"): cv.string,
+    }
+)
+TOGGLE_PET_LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_tracker"): cv.entity_id,
+    }
+)
+UPDATE_DEVICE_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Required("policy_data"): cv.string,
+    }
+)
+
 
 def _get_pet_tracker_entity(call: ServiceCall) -> OnlyCatPetTracker:
     """Get the pet tracker entity from the service call."""
@@ -40,37 +58,19 @@ async def async_setup_services(hass: HomeAssistant, entry: OnlyCatConfigEntry) -
         DOMAIN,
         "set_pet_location",
         async_handle_set_pet_presence,
-        schema=vol.Schema(
-            {
-                vol.Required("device_tracker"): cv.entity_id,
-                vol.Required("location"): cv.string,
-            }
-        ),
+        schema=SET_PET_LOCATION_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         "toggle_pet_location",
         async_handle_toggle_pet_presence,
-        schema=vol.Schema(
-            {
-                vol.Required("device_tracker"): cv.entity_id,
-            }
-        ),
+        schema=TOGGLE_PET_LOCATION_SCHEMA,
     )
-
-    async def update_device_policy_handler(call: ServiceCall) -> ServiceResponse:
-        """Handle service call and inject entry."""
-        return await async_handle_update_device_policy(call, entry)
-
     hass.services.async_register(
         DOMAIN,
         "update_device_policy",
-        update_device_policy_handler,
-        schema=vol.Schema(
-            {
-                vol.Required("policy_data"): cv.string,
-            }
-        ),
+        partial(async_handle_update_device_policy, entry=entry),
+        schema=UPDATE_DEVICE_POLICY_SCHEMA,
     )
 
 
@@ -98,7 +98,7 @@ async def async_handle_update_device_policy(
 ) -> ServiceResponse:
     """Handle the set device policy service call."""
     policy_data: str = call.data["policy_data"]
-    policy_dict = json.loads(policy_data)
+    policy_dict = json_loads(policy_data)
     response = await entry.runtime_data.client.send_message(
         "updateDeviceTransitPolicy", policy_dict
     )
@@ -0,0 +1,107 @@
+"""Tests for OnlyCatApiClient."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from socketio.packet import EVENT
+
+from custom_components.onlycat.api import OnlyCatApiClient, _OrjsonPacket
+
+
+@pytest.mark.asyncio
+async def test_device_event_listeners_are_routed_by_device_id() -> None:
+    """Test that device event listeners only receive events of their device."""
+    client = OnlyCatApiClient(
+        token="token",  # noqa: S106
+        session=MagicMock(),
+        socket=MagicMock(),
+    )
+    global_listener = AsyncMock(name="global_listener")
+    listener_device_1 = AsyncMock(name="device_1_listener")
+    listener_device_2 = AsyncMock(name="device_2_listener")
+    client.add_event_listener("deviceUpdate", global_listener)
+    client.add_device_event_listener(
+        "deviceUpdate", "OC-00000000001", listener_device_1
+    )
+    client.add_device_event_listener(
+        "deviceUpdate", "OC-00000000002", listener_device_2
+    )
+
+    data = {"deviceId": "OC-00000000001", "type": "update", "body": {}}
+    await client.handle_event("deviceUpdate", data)
+
+    global_listener.assert_called_once_with(data)
+    listener_device_1.assert_called_once_with(data)
+    listener_device_2.assert_not_called()
+
+
+def test_orjson_packet_round_trip() -> None:
+    """Test that socket.io packets encode and decode with the orjson codec."""
+    data = ["deviceUpdate", {"deviceId": "OC-00000000001", "body": {"a": [1, 2]}}]
+    encoded = _OrjsonPacket(EVENT, data=data, namespace="/").encode()
+
+    assert (
+        encoded == '2["deviceUpdate",{"deviceId":"OC-00000000001","body":{"a":[1,2]}}]'
+    )
+    assert _OrjsonPacket(encoded_packet=encoded).data == data
+
+
+@pytest.mark.asyncio
+async def test_event_listeners_run_after_earlier_listeners_finished() -> None:
+    """Test that listeners see the state left behind by earlier listeners."""
+
+    async def call(_event: str, data: dict) -> dict:
+        await asyncio.sleep(0)
+        return data
+
+    socket = MagicMock()
+    socket.call = call
+    client = OnlyCatApiClient(
+        token="token",  # noqa: S106
+        session=MagicMock(),
+        socket=socket,
+    )
+    seen_policy_ids = []
+    device = {"deviceTransitPolicyId": 0}
+
+    async def refresh_device(data: dict) -> None:
+        await client.send_message("getDevice", {"deviceId": data["deviceId"]})
+        device["deviceTransitPolicyId"] = data["body"]["deviceTransitPolicyId"]
+
+    async def read_device(_data: dict) -> None:
+        seen_policy_ids.append(device["deviceTransitPolicyId"])
+
+    client.add_device_event_listener("deviceUpdate", "OC-00000000001", refresh_device)
+    client.add_device_event_listener("deviceUpdate", "OC-00000000001", read_device)
+
+    await client.handle_event(
+        "deviceUpdate",
+        {"deviceId": "OC-00000000001", "body": {"deviceTransitPolicyId": 5}},
+    )
+
+    assert seen_policy_ids == [5]
+
+
+@pytest.mark.asyncio
+async def test_removed_event_listeners_are_not_called() -> None:
+    """Test that the functions returned when adding listeners remove them."""
+    client = OnlyCatApiClient(
+        token="token",  # noqa: S106
+        session=MagicMock(),
+        socket=MagicMock(),
+    )
+    global_listener = AsyncMock(name="global_listener")
+    device_listener = AsyncMock(name="device_listener")
+    remove_global = client.add_event_listener("deviceUpdate", global_listener)
+    remove_device = client.add_device_event_listener(
+        "deviceUpdate", "OC-00000000001", device_listener
+    )
+
+    remove_global()
+    remove_device()
+    remove_device()
+    await client.handle_event("deviceUpdate", {"deviceId": "OC-00000000001"})
+
+    global_listener.assert_not_called()
+    device_listener.assert_not_called()
@@ -0,0 +1,50 @@
+"""Test of OnlyCat error sensor entity."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.onlycat import Device
+from custom_components.onlycat.binary_sensor_device_errors import OnlyCatErrorSensor
+
+
+def test_error_sensor_writes_state_when_availability_changes() -> None:
+    """Tests that unchanged errors still write state when a refresh fails."""
+    coordinator = MagicMock()
+    coordinator.data = {"OC-00000000001": {"errors": []}}
+    coordinator.last_update_success = True
+    sensor = OnlyCatErrorSensor(
+        coordinator=coordinator,
+        device=Device(device_id="OC-00000000001", description="Test Cat Flap"),
+        api_client=MagicMock(),
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as write_state:
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        sensor._handle_coordinator_update()  # noqa: SLF001
+        write_state.assert_called_once()
+        write_state.reset_mock()
+
+        coordinator.last_update_success = False
+        sensor._handle_coordinator_update()  # noqa: SLF001
+
+    assert not sensor.available
+    write_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_error_sensor_writes_initial_state_when_added() -> None:
+    """Tests that the sensor writes its state as soon as it is added to hass."""
+    coordinator = MagicMock()
+    coordinator.data = {"OC-00000000001": {"errors": ["flap jammed"]}}
+    sensor = OnlyCatErrorSensor(
+        coordinator=coordinator,
+        device=Device(device_id="OC-00000000001", description="Test Cat Flap"),
+        api_client=MagicMock(),
+    )
+
+    with patch.object(sensor, "async_write_ha_state") as write_state:
+        await sensor.async_added_to_hass()
+
+    assert sensor.is_on
+    write_state.assert_called_once()
@@ -0,0 +1,45 @@
+"""Tests for data/current_schema.py."""
+
+from jsonschema import Draft7Validator
+
+from custom_components.onlycat.data.current_schema import (
+    DEVICE_POLICY_SCHEMA,
+    DEVICE_POLICY_VALIDATOR,
+)
+
+
+def test_device_policy_schema_is_valid() -> None:
+    """Test that the schema passes the draft 7 meta schema."""
+    Draft7Validator.check_schema(DEVICE_POLICY_SCHEMA)
+
+
+def test_device_policy_validator() -> None:
+    """Test that the cached validator accepts and rejects transit policies."""
+    policy = {
+        "deviceTransitPolicyId": 1,
+        "deviceId": "OC-00000000001",
+        "name": "Policy",
+        "transitPolicy": {
+            "rules": [
+                {
+                    "action": {"lock": True},
+                    "criteria": {"eventTriggerSource": 3, "eventClassification": [2]},
+                }
+            ],
+            "idleLock": True,
+            "idleLockBattery": True,
+        },
+    }
+    assert DEVICE_POLICY_VALIDATOR.is_valid(policy)
+    policy["transitPolicy"]["rules"][0]["criteria"]["eventTriggerSource"] = 5
+    assert not DEVICE_POLICY_VALIDATOR.is_valid(policy)
+
+
+def test_device_policy_validator_schema_has_no_docs() -> None:
+    """Test that documentation keywords are stripped but properties are kept."""
+    rule = DEVICE_POLICY_VALIDATOR.schema["properties"]["transitPolicy"]["properties"][
+        "rules"
+    ]["items"]
+    assert "title" not in DEVICE_POLICY_VALIDATOR.schema
+    assert "description" in rule["properties"]
+    assert "description" not in rule["properties"]["description"]
@@ -0,0 +1,96 @@
+"""Tests for data/device.py."""
+
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from custom_components.onlycat.data.device import Device
+from custom_components.onlycat.data.policy import DeviceTransitPolicy
+
+
+@pytest.mark.asyncio
+async def test_update_device_from_api_keeps_local_state() -> None:
+    """Test that API updates only overwrite fields parsed from the response."""
+    config_entry = AsyncMock()
+    listener = MagicMock()
+    settings = {"ignore_flap_motion_rules": False}
+    device = Device(
+        device_id="OC-00000000001",
+        config_entry=config_entry,
+        description="Old name",
+        settings=settings,
+    )
+    device.add_policy_update_listener(listener)
+
+    await device.update_device_from_api(
+        {
+            "deviceId": "OC-00000000001",
+            "description": "New name",
+            "timeZone": "Europe/Zurich",
+        }
+    )
+
+    assert device.description == "New name"
+    assert str(device.time_zone) == "Europe/Zurich"
+    assert device.settings is settings
+    assert device.config_entry is config_entry
+    assert device._policy_update_listeners == (listener,)  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_update_device_from_api_skips_unchanged_payload() -> None:
+    """Test that an unchanged payload is not parsed again but refreshes the policy."""
+    config_entry = AsyncMock()
+    device = Device(device_id="OC-00000000001", config_entry=config_entry)
+    data = {"deviceId": "OC-00000000001", "deviceTransitPolicyId": 1}
+
+    await device.update_device_from_api(data)
+    with patch.object(Device, "_parse_api_fields") as parse_api_fields:
+        await device.update_device_from_api(dict(data))
+
+    parse_api_fields.assert_not_called()
+    assert device.device_transit_policy_id == 1
+    policy_request = call("getDeviceTransitPolicy", {"deviceTransitPolicyId": 1})
+    assert config_entry.runtime_data.client.send_message.await_args_list == [
+        policy_request,
+        policy_request,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_policy_lookups_follow_policy_updates() -> None:
+    """Test that the cached policy lookups are rebuilt when a policy is updated."""
+    device = Device(device_id="OC-00000000001")
+    assert device.get_policy_names() == []
+    assert device.get_policy_id_by_name("Policy1") is None
+
+    await device.update_device_transit_policy(
+        DeviceTransitPolicy(
+            device_transit_policy_id=1, device_id="OC-00000000001", name="Policy1"
+        )
+    )
+
+    assert device.get_policy_names() == ["Policy1"]
+    assert device.get_policy_id_by_name("Policy1") == 1
+    assert device.get_policy_id_by_name("Policy2") is None
+    assert device.get_policy_names() is device.get_policy_names()
+
+
+@pytest.mark.asyncio
+async def test_policy_update_listeners_by_policy_id() -> None:
+    """Test that policy listeners only receive updates of their own policy."""
+    device = Device(device_id="OC-00000000001")
+    listener_all = MagicMock()
+    listener_policy_1 = MagicMock()
+    listener_policy_2 = MagicMock()
+    device.add_policy_update_listener(listener_all)
+    device.add_policy_update_listener(listener_policy_1, 1)
+    device.add_policy_update_listener(listener_policy_2, 2)
+
+    await device.update_device_transit_policy(
+        DeviceTransitPolicy(device_transit_policy_id=1, device_id="OC-00000000001")
+    )
+
+    listener_all.assert_called_once()
+    listener_policy_1.assert_called_once()
+    listener_policy_2.assert_not_called()
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, call
 
 import pytest
 
+from custom_components.onlycat.api import OnlyCatApiClientCommunicationError
 from custom_components.onlycat.data.event import Event
 from custom_components.onlycat.data.event_store import EventStore
 
@@ -108,3 +109,89 @@ async def test_run_listeners_never_calls_with_none() -> None:
         # Verify the argument was never None in any call
         for c in listener.call_args_list:
             assert c != call(None), "Listener must never be called with None"
+
+
+@pytest.mark.asyncio
+async def test_on_event_update_skips_repeated_update() -> None:
+    """Test that an identical eventUpdate is only processed once."""
+    api_client = AsyncMock()
+    store = EventStore(api_client)
+    device_id = "OC-00000000001"
+    store._current_events[device_id] = Event(  # noqa: SLF001
+        device_id=device_id, event_id=1, frame_count=10
+    )
+    data = {"deviceId": device_id, "eventId": 1, "type": "update", "body": {}}
+
+    await store.on_event_update(data)
+    await store.on_event_update(dict(data))
+
+    api_client.send_message.assert_awaited_once_with(
+        "getEvent", {"deviceId": device_id, "eventId": 1, "subscribe": False}
+    )
+
+
+@pytest.mark.asyncio
+async def test_on_event_update_retries_failed_update() -> None:
+    """Test that a repeated eventUpdate is processed again if handling failed."""
+    api_client = AsyncMock()
+    api_client.send_message.side_effect = [OnlyCatApiClientCommunicationError, None]
+    store = EventStore(api_client)
+    device_id = "OC-00000000001"
+    store._current_events[device_id] = Event(  # noqa: SLF001
+        device_id=device_id, event_id=1, frame_count=10
+    )
+    data = {"deviceId": device_id, "eventId": 1, "type": "update", "body": {}}
+
+    with pytest.raises(OnlyCatApiClientCommunicationError):
+        await store.on_event_update(data)
+    await store.on_event_update(dict(data))
+    await store.on_event_update(dict(data))
+
+    assert (
+        api_client.send_message.await_args_list
+        == [call("getEvent", {"deviceId": device_id, "eventId": 1, "subscribe": False})]
+        * 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_on_event_update_skips_repeats_per_device() -> None:
+    """Test that updates of another device do not reset the repeat detection."""
+    api_client = AsyncMock()
+    store = EventStore(api_client)
+    device_ids = ("OC-00000000001", "OC-00000000002")
+    for device_id in device_ids:
+        store._current_events[device_id] = Event(  # noqa: SLF001
+            device_id=device_id, event_id=1, frame_count=10
+        )
+    updates = [
+        {"deviceId": device_id, "eventId": 1, "type": "update", "body": {}}
+        for device_id in device_ids
+    ]
+
+    for data in updates + updates:
+        await store.on_event_update(dict(data))
+
+    assert api_client.send_message.await_args_list == [
+        call("getEvent", {"deviceId": device_id, "eventId": 1, "subscribe": False})
+        for device_id in device_ids
+    ]
+
+
+@pytest.mark.asyncio
+async def test_removed_event_listener_is_not_called() -> None:
+    """Test that the function returned by add_event_listener removes it."""
+    store = EventStore(AsyncMock())
+    device_id = "OC-00000000001"
+    store._current_events[device_id] = Event(device_id=device_id, event_id=1)  # noqa: SLF001
+    removed_listener = AsyncMock(name="removed_listener")
+    kept_listener = AsyncMock(name="kept_listener")
+    remove_listener = store.add_event_listener(device_id, removed_listener)
+    store.add_event_listener(device_id, kept_listener)
+
+    remove_listener()
+    remove_listener()
+    await store.run_event_listeners(device_id)
+
+    removed_listener.assert_not_called()
+    kept_listener.assert_called_once()
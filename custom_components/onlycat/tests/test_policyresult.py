@@ -1,5 +1,7 @@
 """Tests for data/policy.py:determine_policy_result."""
 
+import json
+
 import pytest
 
 from custom_components.onlycat.data.device import Device
@@ -128,3 +130,12 @@ def test_determine_policy_result(test_cases: tuple) -> None:
     transit_policy.device = device
     result = transit_policy.determine_policy_result(event)
     assert result == expected_lock
+
+
+@pytest.mark.parametrize("transit_policy", transit_policies)
+def test_to_json_round_trips_to_dict(transit_policy: DeviceTransitPolicy) -> None:
+    """Test that to_json serializes the policy dict compactly and losslessly."""
+    policy_json = transit_policy.to_json()
+
+    assert json.loads(policy_json) == transit_policy.to_dict()
+    assert ", " not in policy_json
@@ -1,10 +1,16 @@
 """Test of OnlyCat Policy Select entity."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import pytest
 from homeassistant.components.select import SelectEntityDescription
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 
 from custom_components.onlycat import Device
+from custom_components.onlycat.data.policy import DeviceTransitPolicy
 from custom_components.onlycat.select import OnlyCatPolicySelect
 
 get_device_transit_policies = [
@@ -37,4 +43,146 @@ def test_empty_onlycat_policy_slect() -> None:
     )
 
     assert select.device.device_id == "OC-00000000001"
-    mock_coordinator.async_add_listener.assert_called_once()
+    # CoordinatorEntity registers the coordinator listener once added to hass
+    mock_coordinator.async_add_listener.assert_not_called()
+
+
+def test_onlycat_policy_select_skips_unchanged_state() -> None:
+    """Tests that coordinator updates only write state when something changed."""
+    mock_device = Device(
+        device_id="OC-00000000001",
+        description="Test Cat Flap",
+        device_transit_policy_id=None,
+    )
+    select = OnlyCatPolicySelect(
+        coordinator=MagicMock(),
+        device=mock_device,
+        entity_description=SelectEntityDescription(key="onlycat_policy_select"),
+        api_client=MagicMock(),
+    )
+
+    with patch.object(select, "async_write_ha_state") as write_state:
+        select._handle_coordinator_update()  # noqa: SLF001
+        select._handle_coordinator_update()  # noqa: SLF001
+
+    write_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_onlycat_policy_select_coalesces_device_updates(
+    tmp_path: Path,
+) -> None:
+    """Tests that a burst of device updates is applied with a single state write."""
+    mock_device = Device(
+        device_id="OC-00000000001",
+        description="Test Cat Flap",
+        device_transit_policy_id=None,
+    )
+    select = OnlyCatPolicySelect(
+        coordinator=MagicMock(),
+        device=mock_device,
+        entity_description=SelectEntityDescription(key="onlycat_policy_select"),
+        api_client=MagicMock(),
+    )
+    select.hass = HomeAssistant(str(tmp_path))
+
+    try:
+        with (
+            patch("custom_components.onlycat.select.DEVICE_UPDATE_DEBOUNCE", 0),
+            patch.object(select, "set_current_policy") as set_current_policy,
+            patch.object(select, "async_write_ha_state") as write_state,
+        ):
+            await select.async_added_to_hass()
+            for data in (
+                {"deviceId": "OC-00000000001", "body": {"deviceTransitPolicyId": 1}},
+                {"deviceId": "OC-00000000001", "body": {"deviceTransitPolicyId": 2}},
+            ):
+                await select.on_device_update(data)
+            write_state.assert_not_called()
+            await asyncio.sleep(0)
+            await select.hass.async_block_till_done()
+            select._call_on_remove_callbacks()  # noqa: SLF001
+
+        set_current_policy.assert_called_once_with(2)
+        write_state.assert_called_once()
+    finally:
+        await select.hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_onlycat_policy_select_ignores_irrelevant_device_updates() -> None:
+    """Tests that device updates without policy changes are dropped early."""
+    mock_device = Device(
+        device_id="OC-00000000001",
+        description="Test Cat Flap",
+        device_transit_policy_id=None,
+    )
+    select = OnlyCatPolicySelect(
+        coordinator=MagicMock(),
+        device=mock_device,
+        entity_description=SelectEntityDescription(key="onlycat_policy_select"),
+        api_client=MagicMock(),
+    )
+    debouncer = MagicMock(spec=Debouncer)
+    select._device_update_debouncer = debouncer  # noqa: SLF001
+
+    await select.on_device_update(
+        {"deviceId": "OC-00000000001", "body": {"description": "Renamed Flap"}}
+    )
+
+    assert select._pending_device_updates == []  # noqa: SLF001
+    debouncer.async_schedule_call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_onlycat_policy_select_listens_again_after_being_re_added() -> None:
+    """Tests that device listeners are registered whenever the entity is added."""
+    mock_device = Device(
+        device_id="OC-00000000001",
+        description="Test Cat Flap",
+        device_transit_policy_id=None,
+    )
+    api_client = MagicMock()
+    select = OnlyCatPolicySelect(
+        coordinator=MagicMock(),
+        device=mock_device,
+        entity_description=SelectEntityDescription(key="onlycat_policy_select"),
+        api_client=api_client,
+    )
+    api_client.add_device_event_listener.assert_not_called()
+
+    await select.async_added_to_hass()
+    # Renaming the entity id removes the entity and adds the same object again
+    select._call_on_remove_callbacks()  # noqa: SLF001
+    await select.async_added_to_hass()
+
+    assert (
+        api_client.add_device_event_listener.call_args_list
+        == [call("deviceUpdate", "OC-00000000001", select.on_device_update)] * 2
+    )
+    api_client.add_device_event_listener.return_value.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_onlycat_policy_select_queues_update_after_policy_change() -> None:
+    """Tests that device updates are queued once the device's policies changed."""
+    mock_device = Device(
+        device_id="OC-00000000001",
+        description="Test Cat Flap",
+        device_transit_policy_id=None,
+    )
+    select = OnlyCatPolicySelect(
+        coordinator=MagicMock(),
+        device=mock_device,
+        entity_description=SelectEntityDescription(key="onlycat_policy_select"),
+        api_client=MagicMock(),
+    )
+    debouncer = MagicMock(spec=Debouncer)
+    select._device_update_debouncer = debouncer  # noqa: SLF001
+    await mock_device.update_device_transit_policy(
+        DeviceTransitPolicy.from_api_response(get_device_transit_policies[1][0])
+    )
+
+    await select.on_device_update({"deviceId": "OC-00000000001", "body": {}})
+
+    debouncer.async_schedule_call.assert_called_once()